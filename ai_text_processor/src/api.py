@@ -74,7 +74,7 @@ class SimpleTextProcessor:
             return result.processed_text
             
         except Exception as e:
-            self.logger.error(f"Error processing text: {e}")
+            self.logger.error("Error processing text: %s", e)
             return text
 
 
@@ -142,7 +142,7 @@ class AdvancedTextProcessor:
             
         except Exception as e:
             self.monitor.record_processing(0, "unknown", "unknown", False)
-            self.logger.error(f"Error processing text: {e}")
+            self.logger.error("Error processing text: %s", e)
             raise
     
     def batch_process(
@@ -167,7 +167,7 @@ class AdvancedTextProcessor:
                 result = self.process(text, options)
                 results.append(result)
             except Exception as e:
-                self.logger.error(f"Error processing text '{text[:50]}...': {e}")
+                self.logger.error("Error processing text '%s...': %s", text[:50], e)
                 # Create error result
                 error_result = ProcessingResult(
                     original_text=text,
@@ -221,7 +221,7 @@ class AdvancedTextProcessor:
     def add_technical_terms(self, terms: List[str]) -> None:
         """Add technical terms to preserve during processing"""
         self.processor.add_technical_terms(terms)
-        self.logger.info(f"Added {len(terms)} technical terms")
+        self.logger.info("Added %d technical terms", len(terms))
 
 
 class TextProcessorFactory:
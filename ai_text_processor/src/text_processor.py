@@ -138,7 +138,7 @@ class AITextProcessor:
                     # Merge with defaults
                     default_config.update(config)
             except Exception as e:
-                self.logger.warning(f"Could not load config: {e}")
+                self.logger.warning("Could not load config: %s", e)
         
         return default_config
     
@@ -317,7 +317,7 @@ class AITextProcessor:
                 result = self.process_text(text, options)
                 results.append(result)
             except Exception as e:
-                self.logger.error(f"Error processing text: {e}")
+                self.logger.error("Error processing text: %s", e)
                 # Create error result
                 results.append(ProcessingResult(
                     original_text=text,
@@ -344,9 +344,9 @@ class AITextProcessor:
         try:
             with open(file_path, 'r') as f:
                 self.config = json.load(f)
-                self.logger.info(f"Configuration imported from {file_path}")
+                self.logger.info("Configuration imported from %s", file_path)
         except Exception as e:
-            self.logger.error(f"Could not import config: {e}")
+            self.logger.error("Could not import config: %s", e)
 
 
 # Import sub-processors (will be defined below)
@@ -7,6 +7,7 @@ import unittest
 import sys
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -251,6 +252,18 @@ class TestTextAnalyzer(unittest.TestCase):
         self.assertGreater(patterns['patterns']['questions'], 0)
         self.assertGreater(patterns['patterns']['exclamations'], 0)
     
+    def test_overlapping_language_patterns(self):
+        """Test that overlapping pattern categories are counted independently"""
+        text = "Don't visit http://Example.com/page/42 or mail user1@example.com"
+        
+        patterns = TextAnalyzer.detect_language_patterns(text)['patterns']
+        
+        self.assertEqual(patterns['contractions'], 1)
+        self.assertEqual(patterns['urls'], 1)
+        self.assertEqual(patterns['emails'], 1)
+        self.assertEqual(patterns['numbers'], 2)
+        self.assertEqual(patterns['capitalized_words'], 2)
+    
     def test_text_type_identification(self):
         """Test text type identification"""
         texts = {
@@ -374,6 +387,15 @@ class TestTextUtils(unittest.TestCase):
         
         self.assertLessEqual(len(truncated), 23)  # 20 + 3 for "..."
         self.assertTrue(truncated.endswith("..."))
+    
+    def test_batch_truncation(self):
+        """Test batch truncation matches single truncation"""
+        texts = ["short", "This is a long text that should be truncated.", ""]
+        for max_length in (2, 20):
+            self.assertEqual(
+                TextUtils.truncate_batch(texts, max_length),
+                [TextUtils.truncate_text(text, max_length) for text in texts]
+            )
 
 
 class TestConvenienceFunctions(unittest.TestCase):
@@ -481,6 +503,22 @@ class TestPerformance(unittest.TestCase):
         # Should complete within reasonable time
         self.assertLess(total_time, 10.0)
         self.assertEqual(len(results), 10)
+    
+    def test_concurrent_metrics_recording(self):
+        """Test that concurrent metric updates are not lost"""
+        monitor = PerformanceMonitor()
+        
+        def record():
+            for _ in range(1000):
+                monitor.record_processing(0.001, "general", "neutral")
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(8):
+                executor.submit(record)
+        
+        report = monitor.get_report()
+        self.assertEqual(report["total_processed"], 8000)
+        self.assertEqual(report["context_breakdown"]["general"], 8000)
 
 
 def run_all_tests():
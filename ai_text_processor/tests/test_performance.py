@@ -2,15 +2,67 @@
 Performance and benchmark tests for AI Text Processor
 """
 
+import os
+import asyncio
+import sys
+import functools
+import gc
+import itertools
 import pytest
 import time
 import statistics
+import tracemalloc
 import concurrent.futures
 from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 from src.api import SimpleTextProcessor, AdvancedTextProcessor
 from src.text_processor import ProcessingOptions, ProcessingContext, ToneType
+from utils.text_utils import CacheManager
+
+# Texts handed to a pool worker per submission
+BATCH_CHUNK_SIZE = 16
+
+# Shared inputs for cache contention tests (length must stay a power of two)
+CANONICAL_TEXTS = [f"Shared cache test text {i}." for i in range(8)]
+
+
+@pytest.fixture(scope="module")
+def shared_pool():
+    """Thread pool reused by all concurrency tests in this module
+
+    Sized to this worker's share of the cores so pytest-xdist runs do
+    not oversubscribe the machine.
+    """
+    xdist_workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+    max_workers = max(1, (os.cpu_count() or 1) // xdist_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield executor
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warmup():
+    """Run the processing and analysis paths once before any timing starts
+
+    First calls pay for regex compilation and lazy imports, which would
+    otherwise land in whichever benchmark happens to run first.
+    """
+    text = "Warm up the processor."
+    SimpleTextProcessor().process(text, aggressive=True)
+    AdvancedTextProcessor().analyze_text(text)
+
+
+@pytest.fixture(scope="session")
+def large_text():
+    """~1M character input built once per session"""
+    base_sentence = "This is a test sentence with various words and punctuation for performance testing."
+    return (base_sentence + " ") * 10000
+
+
+@pytest.fixture
+def advanced_processor():
+    """Fresh AdvancedTextProcessor with an empty cache"""
+    return AdvancedTextProcessor()
 
 
 class TestPerformanceBenchmarks:
@@ -20,18 +72,14 @@ class TestPerformanceBenchmarks:
     def processor(self):
         return SimpleTextProcessor()
     
-    @pytest.fixture
-    def advanced_processor(self):
-        return AdvancedTextProcessor()
-    
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_texts(self):
         return [
             "Short text.",
             "This is a medium length sentence with some complexity.",
-            "This is a much longer text that contains multiple sentences and should take longer to process. " * 10,
-            "Technical documentation with API endpoints, JSON data structures, and various programming concepts. " * 20,
-            "Very long academic text with complex vocabulary, multiple clauses, subordinate phrases, and advanced grammatical structures that should test the limits of the processing system. " * 50
+            "".join(["This is a much longer text that contains multiple sentences and should take longer to process. "] * 10),
+            "".join(["Technical documentation with API endpoints, JSON data structures, and various programming concepts. "] * 20),
+            "".join(["Very long academic text with complex vocabulary, multiple clauses, subordinate phrases, and advanced grammatical structures that should test the limits of the processing system. "] * 50)
         ]
     
     def test_processing_speed_benchmark(self, processor, benchmark):
@@ -48,7 +96,8 @@ class TestPerformanceBenchmarks:
     @pytest.mark.performance
     def test_batch_processing_efficiency(self, advanced_processor, benchmark):
         """Test batch processing efficiency"""
-        texts = ["Sample text for batch processing."] * 100
+        canonical = sys.intern("Sample text for batch processing.")
+        texts = [canonical] * 100
         
         def batch_process():
             return advanced_processor.batch_process(texts)
@@ -56,27 +105,29 @@ class TestPerformanceBenchmarks:
         result = benchmark(batch_process)
         assert len(result) == 100
         assert all(hasattr(r, 'processed_text') for r in result)
+        
+        # Identical inputs should collapse to a single cache entry
+        assert advanced_processor.cache.size() == 1
     
     @pytest.mark.performance
-    def test_concurrent_processing(self, advanced_processor):
+    def test_concurrent_processing(self, advanced_processor, shared_pool):
         """Test concurrent processing performance"""
         texts = ["Concurrent test text."] * 50
         
         # Sequential processing
-        start_time = time.time()
+        start_time = time.perf_counter()
         sequential_results = []
         for text in texts:
             result = advanced_processor.process(text)
             sequential_results.append(result)
-        sequential_time = time.time() - start_time
+        sequential_time = time.perf_counter() - start_time
         
         # Concurrent processing
-        start_time = time.time()
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            concurrent_results = list(executor.map(
-                advanced_processor.process, texts
-            ))
-        concurrent_time = time.time() - start_time
+        start_time = time.perf_counter()
+        chunks = [texts[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(texts), BATCH_CHUNK_SIZE)]
+        batches = shared_pool.map(functools.partial(process_batch, advanced_processor.process), chunks)
+        concurrent_results = [result for batch in batches for result in batch]
+        concurrent_time = time.perf_counter() - start_time
         
         # Concurrent should be faster (or at least not significantly slower)
         print(f"Sequential: {sequential_time:.3f}s, Concurrent: {concurrent_time:.3f}s")
@@ -84,45 +135,54 @@ class TestPerformanceBenchmarks:
         assert all(hasattr(r, 'processed_text') for r in concurrent_results)
     
     @pytest.mark.performance
-    def test_large_text_processing(self, processor):
-        """Test processing of very large texts"""
-        # Create a very large text
-        base_sentence = "This is a test sentence with various words and punctuation for performance testing."
-        large_text = (base_sentence + " ") * 10000  # ~1M characters
+    def test_async_concurrent_processing(self, advanced_processor):
+        """Test concurrent processing driven from an event loop"""
+        texts = ["Async concurrent test text."] * 50
         
-        start_time = time.time()
-        result = processor.process(large_text)
-        processing_time = time.time() - start_time
+        async def process_all():
+            return await asyncio.gather(*(
+                asyncio.to_thread(advanced_processor.process, text) for text in texts
+            ))
         
-        print(f"Processed {len(large_text)} characters in {processing_time:.3f}s")
+        start_time = time.perf_counter()
+        results = asyncio.run(process_all())
+        async_time = time.perf_counter() - start_time
+        
+        print(f"Async: {async_time:.3f}s")
+        assert len(results) == 50
+        assert all(hasattr(r, 'processed_text') for r in results)
+    
+    @pytest.mark.performance
+    def test_large_text_processing(self, processor, large_text, benchmark):
+        """Test processing of very large texts"""
+        result = benchmark.pedantic(processor.process, args=(large_text,), rounds=5, warmup_rounds=1)
+        processing_time = benchmark_mean(benchmark)
         
         assert len(result) > 0
-        assert processing_time < 10.0  # Should complete within 10 seconds
+        if processing_time is not None:
+            print(f"Processed {len(large_text)} characters in {processing_time:.3f}s")
+            assert processing_time < 10.0  # Should complete within 10 seconds
     
     @pytest.mark.performance
     def test_memory_usage_during_batch_processing(self, advanced_processor):
         """Test memory usage during batch processing"""
         texts = ["Memory test text."] * 1000
         
-        # Get initial memory usage (if psutil is available)
+        # Track Python allocations made during the batch
+        tracemalloc.start()
         try:
-            import psutil
-            process = psutil.Process()
-            initial_memory = process.memory_info().rss
-        except ImportError:
-            initial_memory = 0
-        
-        start_time = time.time()
-        results = advanced_processor.batch_process(texts)
-        processing_time = time.time() - start_time
+            baseline, _ = tracemalloc.get_traced_memory()
+            
+            start_time = time.perf_counter()
+            results = advanced_processor.batch_process(texts)
+            processing_time = time.perf_counter() - start_time
+            
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
         
-        # Check final memory usage
-        try:
-            final_memory = process.memory_info().rss
-            memory_increase = final_memory - initial_memory
-            print(f"Memory increase: {memory_increase / 1024 / 1024:.2f} MB")
-        except (ImportError, NameError):
-            memory_increase = 0
+        memory_increase = peak - baseline
+        print(f"Peak memory increase: {memory_increase / 1024 / 1024:.2f} MB")
         
         assert len(results) == 1000
         assert processing_time < 30.0  # Should complete within 30 seconds
@@ -134,48 +194,56 @@ class TestPerformanceBenchmarks:
         text = "This is a text for cache performance testing."
         
         # First run (cache miss)
-        start_time = time.time()
+        start_time = time.perf_counter()
         result1 = advanced_processor.process(text)
-        first_run_time = time.time() - start_time
+        first_run_time = time.perf_counter() - start_time
         
         # Second run (cache hit)
-        start_time = time.time()
+        start_time = time.perf_counter()
         result2 = advanced_processor.process(text)
-        second_run_time = time.time() - start_time
+        second_run_time = time.perf_counter() - start_time
         
         print(f"First run: {first_run_time:.4f}s, Second run: {second_run_time:.4f}s")
         
         assert result1.processed_text == result2.processed_text
-        assert second_run_time < first_run_time  # Cache should be faster
+        
+        # Second call should be served from cache
+        cache = advanced_processor.cache
+        assert cache.misses == 1
+        assert cache.hits == 1
     
     @pytest.mark.performance
-    def test_text_analysis_performance(self, advanced_processor):
+    def test_text_analysis_performance(self, advanced_processor, benchmark):
         """Test performance of text analysis features"""
         text = "This is a comprehensive test for analysis performance. " * 100
         
-        start_time = time.time()
-        analysis = advanced_processor.analyze_text(text)
-        analysis_time = time.time() - start_time
+        # A distinct input per round so the analyzers' memo caches never hit
+        rounds = itertools.count()
+        def fresh_text():
+            return (f"{text}Round {next(rounds)}.",), {}
         
-        print(f"Analysis completed in {analysis_time:.3f}s")
+        analysis = benchmark.pedantic(advanced_processor.analyze_text, setup=fresh_text, rounds=5, warmup_rounds=1)
+        analysis_time = benchmark_mean(benchmark)
         
-        assert analysis_time < 5.0  # Should complete within 5 seconds
         assert 'readability' in analysis
         assert 'statistics' in analysis
         assert 'keywords' in analysis
+        if analysis_time is not None:
+            print(f"Analysis completed in {analysis_time:.3f}s")
+            assert analysis_time < 5.0  # Should complete within 5 seconds
     
     @pytest.mark.performance
     def test_aggressive_processing_performance(self, processor):
         """Test performance of aggressive processing options"""
         text = "This is like, basically, really important for testing performance with aggressive processing enabled."
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = processor.process(text, aggressive=True)
-        aggressive_time = time.time() - start_time
+        aggressive_time = time.perf_counter() - start_time
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         result_normal = processor.process(text, aggressive=False)
-        normal_time = time.time() - start_time
+        normal_time = time.perf_counter() - start_time
         
         print(f"Aggressive: {aggressive_time:.4f}s, Normal: {normal_time:.4f}s")
         
@@ -184,23 +252,22 @@ class TestPerformanceBenchmarks:
         # Aggressive processing might be slower due to more complex operations
     
     @pytest.mark.performance
-    def test_context_switching_performance(self, processor):
+    def test_context_switching_performance(self, processor, benchmark):
         """Test performance when switching between different contexts"""
         text = "This is a test for context switching performance."
         contexts = ['email', 'code', 'document', 'social', 'technical']
         
-        start_time = time.time()
-        results = []
-        for context in contexts:
-            result = processor.process(text, context=context)
-            results.append(result)
-        context_switching_time = time.time() - start_time
+        def switch_contexts():
+            return [processor.process(text, context=context) for context in contexts]
         
-        print(f"Context switching for {len(contexts)} contexts took {context_switching_time:.3f}s")
+        results = benchmark.pedantic(switch_contexts, rounds=5, warmup_rounds=1)
+        context_switching_time = benchmark_mean(benchmark)
         
         assert len(results) == len(contexts)
         assert all(len(result) > 0 for result in results)
-        assert context_switching_time < 5.0  # Should complete within 5 seconds
+        if context_switching_time is not None:
+            print(f"Context switching for {len(contexts)} contexts took {context_switching_time:.3f}s")
+            assert context_switching_time < 5.0  # Should complete within 5 seconds
 
 
 class TestScalabilityTests:
@@ -215,25 +282,23 @@ class TestScalabilityTests:
         batch_size = 10
         texts = ["Load test text for sustained performance."] * batch_size
         
-        start_time = time.time()
+        start_time = time.perf_counter()
+        deadline = time.monotonic_ns() + duration * 1_000_000_000
         processed_count = 0
         processing_times = []
         
-        while time.time() - start_time < duration:
-            batch_start = time.time()
+        while time.monotonic_ns() < deadline:
+            batch_start = time.perf_counter()
             
             # Process batch
             for text in texts:
                 result = processor.process(text)
                 processed_count += 1
             
-            batch_time = time.time() - batch_start
+            batch_time = time.perf_counter() - batch_start
             processing_times.append(batch_time)
-            
-            # Brief pause between batches
-            time.sleep(0.1)
         
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         
         # Calculate statistics
         avg_time = statistics.mean(processing_times)
@@ -254,147 +319,130 @@ class TestScalabilityTests:
         """Test memory growth during extended processing"""
         processor = SimpleTextProcessor()
         iterations = 1000
+        texts = [f"Memory test iteration {i} for growth analysis." for i in range(iterations)]
         
+        # Collect garbage and freeze survivors so only new allocations are measured
+        gc.collect()
+        gc.freeze()
+        tracemalloc.start()
         try:
-            import psutil
-            process = psutil.Process()
-            initial_memory = process.memory_info().rss
-            memory_samples = [initial_memory]
-        except ImportError:
-            initial_memory = 0
-            memory_samples = [0]
-        
-        for i in range(iterations):
-            text = f"Memory test iteration {i} for growth analysis."
-            result = processor.process(text)
+            memory_samples = [tracemalloc.get_traced_memory()[0]]
             
-            # Sample memory every 100 iterations
-            if i % 100 == 0:
-                try:
-                    current_memory = process.memory_info().rss
-                    memory_samples.append(current_memory)
-                except NameError:
-                    pass
-        
-        # Analyze memory growth
-        if len(memory_samples) > 1:
+            for i in range(iterations):
+                result = processor.process(texts[i])
+                
+                # Sample memory every 100 iterations
+                if i % 100 == 0:
+                    memory_samples.append(tracemalloc.get_traced_memory()[0])
+            
+            # Drop uncollected garbage so it is not mistaken for a leak
+            gc.collect()
+            memory_samples.append(tracemalloc.get_traced_memory()[0])
+            
+            # Analyze memory growth
             memory_growth = memory_samples[-1] - memory_samples[0]
             print(f"Memory growth after {iterations} iterations: {memory_growth / 1024 / 1024:.2f} MB")
             
             # Memory growth should be reasonable (not excessive leaks)
-            assert memory_growth < 100 * 1024 * 1024  # Less than 100MB growth
+            if memory_growth >= 5 * 1024 * 1024:  # Less than 5MB growth
+                top_stats = tracemalloc.take_snapshot().statistics('lineno')[:5]
+                pytest.fail("Excessive memory growth:\n" + "\n".join(str(stat) for stat in top_stats))
+        finally:
+            tracemalloc.stop()
+            gc.unfreeze()
     
     @pytest.mark.performance
-    def test_cache_eviction_performance(self, advanced_processor):
-        """Test cache eviction under memory pressure"""
-        # Fill cache with many entries
-        texts = [f"Cache test text {i} for eviction testing." for i in range(1000)]
+    def test_cache_eviction_policy(self):
+        """Test that a full cache evicts the least recently used entry"""
+        cache = CacheManager()
+        texts = [f"Cache test text {i} for eviction testing." for i in range(cache.max_size)]
         
-        start_time = time.time()
-        for text in texts:
-            advanced_processor.process(text)
-        fill_time = time.time() - start_time
+        start_time = time.perf_counter()
+        for i, text in enumerate(texts):
+            cache.set(text, "default", i)
         
-        # Clear cache and measure
-        cache = advanced_processor.cache
-        cache.clear()
-        assert cache.size() == 0
+        # Touch the oldest entry, then overflow the cache by one
+        assert cache.get(texts[0], "default") == 0
+        cache.set("Overflow entry.", "default", -1)
+        fill_time = time.perf_counter() - start_time
+        
+        print(f"Filled cache with {len(texts) + 1} entries in {fill_time:.3f}s")
         
-        print(f"Filled cache with {len(texts)} entries in {fill_time:.3f}s")
+        assert cache.size() == cache.max_size
+        assert cache.get(texts[0], "default") == 0  # Recently used entry survives
+        assert cache.get(texts[1], "default") is None  # Least recently used entry evicted
 
 
 class TestConcurrencyTests:
     """Tests for concurrent processing scenarios"""
     
     @pytest.mark.performance
-    def test_thread_safety(self):
+    def test_thread_safety(self, shared_pool):
         """Test thread safety of processors"""
-        from threading import Thread
-        from queue import Queue
-        
         processor = SimpleTextProcessor()
-        queue = Queue()
         num_threads = 10
         texts_per_thread = 50
+        texts = [
+            [f"Thread {thread_id} text {i}." for i in range(texts_per_thread)]
+            for thread_id in range(num_threads)
+        ]
+        
+        # Each worker owns a disjoint slice, so no lock or queue is needed
+        results = [None] * (num_threads * texts_per_thread)
         
         def process_worker(thread_id):
-            for i in range(texts_per_thread):
-                text = f"Thread {thread_id} text {i}."
+            for i, text in enumerate(texts[thread_id]):
                 try:
                     result = processor.process(text)
-                    queue.put((thread_id, i, len(result)))
+                    results[thread_id * texts_per_thread + i] = (thread_id, i, len(result))
                 except Exception as e:
-                    queue.put((thread_id, i, str(e)))
+                    results[thread_id * texts_per_thread + i] = (thread_id, i, str(e))
         
-        # Start threads
-        threads = []
-        start_time = time.time()
-        for thread_id in range(num_threads):
-            thread = Thread(target=process_worker, args=(thread_id,))
-            threads.append(thread)
-            thread.start()
+        # Submit workers
+        start_time = time.perf_counter()
+        futures = [shared_pool.submit(process_worker, thread_id) for thread_id in range(num_threads)]
         
         # Wait for completion
-        for thread in threads:
-            thread.join()
+        concurrent.futures.wait(futures)
         
-        total_time = time.time() - start_time
-        
-        # Collect results
-        results = []
-        while not queue.empty():
-            results.append(queue.get())
+        total_time = time.perf_counter() - start_time
         
         print(f"Processed {len(results)} texts with {num_threads} threads in {total_time:.2f}s")
         
         # Verify all tasks completed
-        assert len(results) == num_threads * texts_per_thread
+        assert None not in results
         
         # Check for errors
         errors = [r for r in results if isinstance(r[2], str)]
         assert len(errors) == 0, f"Found {len(errors)} errors during concurrent processing"
     
     @pytest.mark.performance
-    def test_shared_cache_thread_safety(self, advanced_processor):
+    def test_shared_cache_thread_safety(self, advanced_processor, shared_pool):
         """Test thread safety of shared cache"""
-        from threading import Thread
-        from threading import Lock
-        import time
-        
         cache = advanced_processor.cache
-        lock = Lock()
-        results = []
         
         def cache_worker(worker_id):
+            local_results = []
             for i in range(50):
-                text = f"Worker {worker_id} cache test {i}."
+                # Workers cycle through a shared set of texts so cache hits and misses interleave
+                text = CANONICAL_TEXTS[(worker_id * 7 + i) & 7]
                 
                 try:
                     result = advanced_processor.process(text)
-                    with lock:
-                        results.append(result.processed_text)
+                    local_results.append(result.processed_text)
                 except Exception as e:
-                    with lock:
-                        results.append(f"Error: {e}")
-                
-                # Small delay to encourage cache interactions
-                time.sleep(0.01)
+                    local_results.append(f"Error: {e}")
+            return local_results
         
         # Start workers
         workers = 5
-        threads = []
-        start_time = time.time()
+        start_time = time.perf_counter()
+        futures = [shared_pool.submit(cache_worker, worker_id) for worker_id in range(workers)]
         
-        for worker_id in range(workers):
-            thread = Thread(target=cache_worker, args=(worker_id,))
-            threads.append(thread)
-            thread.start()
+        # Wait for completion and merge per-worker results
+        results = list(itertools.chain.from_iterable(f.result() for f in futures))
         
-        # Wait for completion
-        for thread in threads:
-            thread.join()
-        
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         
         print(f"Cache stress test with {workers} workers completed in {total_time:.2f}s")
         print(f"Cache size: {cache.size()}")
@@ -406,7 +454,17 @@ class TestConcurrencyTests:
 
 def processing_time_processor(processor, text):
     """Helper function for pytest-benchmark"""
-    start_time = time.time()
+    start_time = time.perf_counter()
     result = processor.process(text)
-    processing_time = time.time() - start_time
-    return result, processing_time
\ No newline at end of file
+    processing_time = time.perf_counter() - start_time
+    return result, processing_time
+
+
+def benchmark_mean(benchmark):
+    """Mean benchmark time, or None when pytest-benchmark is disabled (e.g. under xdist)"""
+    return benchmark.stats["mean"] if benchmark.stats else None
+
+
+def process_batch(fn, items):
+    """Apply fn to a chunk of items inside a single pool task"""
+    return [fn(item) for item in items]
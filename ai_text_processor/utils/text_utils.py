@@ -4,13 +4,194 @@ Provides helper functions for text analysis, validation, and processing
 """
 
 import re
+import sys
+import heapq
+import threading
 import time
-import hashlib
 from typing import List, Dict, Any, Optional, Tuple, Set
-from collections import Counter
+from collections import Counter, OrderedDict, defaultdict
+from functools import lru_cache
+from operator import itemgetter
 import logging
 
 
+# Precompiled patterns shared by the analyzers and utilities below
+_WORD_RE = re.compile(r'\b\w+\b')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+# A sentence body: a run between terminators with at least one visible char
+_SENTENCE_BODY_RE = re.compile(r'[^.!?\s][^.!?]*')
+_EMAIL_LIKE_RE = re.compile(r'\S+@\S+')
+_CODE_KEYWORD_RE = re.compile(r'\b(def|function|class|import|if|for|while)\b')
+_MULTI_SENTENCE_RE = re.compile(r'[.!?].*[.!?]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_DEFAULT_SUFFIX = "..."
+_VOWEL_GROUP_RE = re.compile(r'[aeiouy]+')
+
+# Language pattern categories for detect_language_patterns. Categories may
+# overlap (a number inside a URL counts for both), so each is counted on its own.
+_LANGUAGE_PATTERNS = {
+    "contractions": re.compile(r"\w+'\w+"),
+    "numbers": re.compile(r'\d+'),
+    "urls": re.compile(r'http[s]?://\S+'),
+    "emails": re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+    "capitalized_words": re.compile(r'\b[A-Z][a-z]+\b'),
+    "all_caps_words": re.compile(r'\b[A-Z]{2,}\b')
+}
+
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
+    'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
+    'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
+})
+
+# Sentiment indicators
+_POSITIVE_WORDS = frozenset({'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'awesome'})
+_NEGATIVE_WORDS = frozenset({'bad', 'terrible', 'awful', 'horrible', 'disgusting', 'hate', 'dislike'})
+
+# Keyword indicators for identify_text_type
+_TEXT_TYPE_TERMS = {
+    "email": ('dear', 'hello', 'best regards', 'sincerely'),
+    "document": ('therefore', 'furthermore', 'however'),
+    "technical": ('api', 'database', 'server', 'client', 'protocol', 'algorithm'),
+    "creative": ('story', 'poem', 'novel', 'metaphor')
+}
+_SUSPICIOUS_PATTERNS = [
+    (re.compile(r'<script', re.IGNORECASE), "Potentially unsafe HTML content"),
+    (re.compile(r'javascript:', re.IGNORECASE), "Potentially unsafe JavaScript"),
+    (re.compile(r'on\w+\s*=', re.IGNORECASE), "Potentially unsafe event handlers")
+]
+_SUSPICIOUS_RE = re.compile(r'<script|javascript:|on\w+\s*=', re.IGNORECASE)
+
+
+# Memoized analyzer implementations. Results depend only on the text, so
+# repeated analysis of the same document is a cache lookup; the public
+# wrappers hand out copies so callers cannot mutate cached values. Texts
+# longer than _MEMO_MAX_CHARS bypass the caches so large documents are
+# not kept alive by them.
+_MEMO_MAX_CHARS = 16384
+
+
+def _memoized(impl, text: str, *args):
+    """Call a memoized implementation, skipping the cache for long texts"""
+    if len(text) <= _MEMO_MAX_CHARS:
+        return impl(text, *args)
+    return impl.__wrapped__(text, *args)
+
+
+@lru_cache(maxsize=256)
+def _readability_impl(text: str) -> Dict[str, float]:
+    # Count non-blank sentences without building the split/stripped lists
+    sentence_count = sum(1 for _ in _SENTENCE_BODY_RE.finditer(text))
+    
+    words = _WORD_RE.findall(text.lower())
+    word_count = len(words)
+    
+    if word_count == 0 or sentence_count == 0:
+        return {
+            "flesch_score": 0.0,
+            "avg_sentence_length": 0.0,
+            "avg_syllables_per_word": 0.0
+        }
+    
+    # Calculate syllables once per distinct word, weighted by frequency
+    total_syllables = sum(
+        TextAnalyzer.count_syllables(word) * count
+        for word, count in Counter(words).items()
+    )
+    
+    # Flesch Reading Ease Score
+    avg_sentence_length = word_count / sentence_count
+    avg_syllables_per_word = total_syllables / word_count
+    flesch_score = 206.835 - 1.015 * avg_sentence_length - 84.6 * avg_syllables_per_word
+    
+    return {
+        "flesch_score": max(0, min(100, flesch_score)),
+        "avg_sentence_length": avg_sentence_length,
+        "avg_syllables_per_word": avg_syllables_per_word,
+        "total_words": word_count,
+        "total_sentences": sentence_count,
+        "total_syllables": total_syllables
+    }
+
+
+@lru_cache(maxsize=256)
+def _text_type_impl(text: str) -> Dict[str, Any]:
+    text_lower = text.lower()
+    
+    # Scoring system for different text types
+    scores = {
+        "email": 0,
+        "code": 0,
+        "document": 0,
+        "social": 0,
+        "technical": 0,
+        "creative": 0
+    }
+    
+    # Keyword categories present in the text; substring checks run in C
+    # and stop at the first hit per category
+    matched = {
+        category for category, terms in _TEXT_TYPE_TERMS.items()
+        if any(term in text_lower for term in terms)
+    }
+    
+    # Email indicators
+    if "email" in matched:
+        scores["email"] += 2
+    if '@' in text and _EMAIL_LIKE_RE.search(text):
+        scores["email"] += 3
+    
+    # Code indicators
+    if any(char in text for char in '{}();='):
+        scores["code"] += 2
+    if _CODE_KEYWORD_RE.search(text_lower):
+        scores["code"] += 3
+    
+    # Document indicators
+    if len(text.split('\n\n')) > 2:  # Multiple paragraphs
+        scores["document"] += 1
+    if "document" in matched:
+        scores["document"] += 2
+    
+    # Social media indicators
+    if '#' in text or '@' in text:
+        scores["social"] += 2
+    if len(text) < 200 and ('!' in text or '?' in text):
+        scores["social"] += 1
+    
+    # Technical indicators
+    if "technical" in matched:
+        scores["technical"] += 2
+    
+    # Creative indicators
+    if "creative" in matched:
+        scores["creative"] += 2
+    if len(_MULTI_SENTENCE_RE.findall(text)) > 2:  # Complex sentence structure
+        scores["creative"] += 1
+    
+    # Determine primary type
+    primary_type = max(scores, key=scores.get)
+    confidence = scores[primary_type] / sum(scores.values()) if sum(scores.values()) > 0 else 0
+    
+    return {
+        "primary_type": primary_type,
+        "confidence": min(confidence, 1.0),
+        "scores": scores
+    }
+
+
+@lru_cache(maxsize=256)
+def _keywords_impl(text: str, max_keywords: int) -> Tuple[str, ...]:
+    # Simple keyword extraction based on frequency, skipping stop words
+    word_freq = Counter(
+        word for word in _WORD_RE.findall(text.lower())
+        if len(word) > 2 and word not in _STOP_WORDS
+    )
+    
+    return tuple(word for word, freq in word_freq.most_common(max_keywords))
+
+
 class TextAnalyzer:
     """Advanced text analysis utilities"""
     
@@ -18,17 +199,8 @@ class TextAnalyzer:
     def count_syllables(word: str) -> int:
         """Count syllables in a word (approximate)"""
         word = word.lower()
-        vowels = 'aeiouy'
-        syllable_count = 0
-        previous_was_vowel = False
-        
-        for char in word:
-            if char in vowels:
-                if not previous_was_vowel:
-                    syllable_count += 1
-                previous_was_vowel = True
-            else:
-                previous_was_vowel = False
+        # Each run of consecutive vowels is one syllable
+        syllable_count = len(_VOWEL_GROUP_RE.findall(word))
         
         # Handle silent 'e'
         if word.endswith('e') and syllable_count > 1:
@@ -39,64 +211,33 @@ class TextAnalyzer:
     @staticmethod
     def calculate_readability(text: str) -> Dict[str, float]:
         """Calculate readability metrics"""
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        words = re.findall(r'\b\w+\b', text.lower())
-        word_count = len(words)
-        sentence_count = len(sentences)
-        
-        if word_count == 0 or sentence_count == 0:
-            return {
-                "flesch_score": 0.0,
-                "avg_sentence_length": 0.0,
-                "avg_syllables_per_word": 0.0
-            }
-        
-        # Calculate syllables
-        total_syllables = sum(TextAnalyzer.count_syllables(word) for word in words)
-        
-        # Flesch Reading Ease Score
-        avg_sentence_length = word_count / sentence_count
-        avg_syllables_per_word = total_syllables / word_count
-        flesch_score = 206.835 - 1.015 * avg_sentence_length - 84.6 * avg_syllables_per_word
-        
-        return {
-            "flesch_score": max(0, min(100, flesch_score)),
-            "avg_sentence_length": avg_sentence_length,
-            "avg_syllables_per_word": avg_syllables_per_word,
-            "total_words": word_count,
-            "total_sentences": sentence_count,
-            "total_syllables": total_syllables
-        }
+        return dict(_memoized(_readability_impl, text))
     
     @staticmethod
     def detect_language_patterns(text: str) -> Dict[str, Any]:
         """Detect language patterns and characteristics"""
-        words = re.findall(r'\b\w+\b', text.lower())
+        words = _WORD_RE.findall(text.lower())
         
         # Common patterns
         patterns = {
-            "questions": len(re.findall(r'\?', text)),
-            "exclamations": len(re.findall(r'!', text)),
-            "contractions": len(re.findall(r'\w+\'\w+', text)),
-            "numbers": len(re.findall(r'\d+', text)),
-            "urls": len(re.findall(r'http[s]?://\S+', text)),
-            "emails": len(re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)),
-            "capitalized_words": len(re.findall(r'\b[A-Z][a-z]+\b', text)),
-            "all_caps_words": len(re.findall(r'\b[A-Z]{2,}\b', text))
+            "questions": text.count('?'),
+            "exclamations": text.count('!')
         }
-        
-        # Common word analysis
-        word_freq = Counter(words)
-        common_words = set(word_freq.most_common(20))
-        
-        # Sentiment indicators
-        positive_words = {'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'awesome'}
-        negative_words = {'bad', 'terrible', 'awful', 'horrible', 'disgusting', 'hate', 'dislike'}
-        
-        positive_count = sum(1 for word in words if word in positive_words)
-        negative_count = sum(1 for word in words if word in negative_words)
+        for name, pattern in _LANGUAGE_PATTERNS.items():
+            patterns[name] = sum(1 for _ in pattern.finditer(text))
+        
+        # Word frequencies and sentiment indicators in a single pass
+        word_freq = {}
+        positive_count = negative_count = 0
+        for word in words:
+            word_freq[word] = word_freq.get(word, 0) + 1
+            if word in _POSITIVE_WORDS:
+                positive_count += 1
+            elif word in _NEGATIVE_WORDS:
+                negative_count += 1
+        unique_words = len(word_freq)
+        # Top 20 in one selection; the distribution below is its first 10
+        common_words = heapq.nlargest(20, word_freq.items(), key=itemgetter(1))
         
         return {
             "patterns": patterns,
@@ -107,71 +248,17 @@ class TextAnalyzer:
                 "score": positive_count - negative_count
             },
             "complexity": {
-                "unique_words": len(set(words)),
-                "vocabulary_richness": len(set(words)) / len(words) if words else 0,
-                "word_frequency_distribution": dict(word_freq.most_common(10))
+                "unique_words": unique_words,
+                "vocabulary_richness": unique_words / len(words) if words else 0,
+                "word_frequency_distribution": dict(common_words[:10])
             }
         }
     
     @staticmethod
     def identify_text_type(text: str) -> Dict[str, Any]:
         """Identify the type of text based on content"""
-        text_lower = text.lower()
-        
-        # Scoring system for different text types
-        scores = {
-            "email": 0,
-            "code": 0,
-            "document": 0,
-            "social": 0,
-            "technical": 0,
-            "creative": 0
-        }
-        
-        # Email indicators
-        if any(word in text_lower for word in ['dear', 'hello', 'best regards', 'sincerely']):
-            scores["email"] += 2
-        if '@' in text and len(re.findall(r'\S+@\S+', text)) > 0:
-            scores["email"] += 3
-        
-        # Code indicators
-        if any(char in text for char in ['{', '}', '(', ')', ';', '=']):
-            scores["code"] += 2
-        if re.search(r'\b(def|function|class|import|if|for|while)\b', text_lower):
-            scores["code"] += 3
-        
-        # Document indicators
-        if len(text.split('\n\n')) > 2:  # Multiple paragraphs
-            scores["document"] += 1
-        if any(word in text_lower for word in ['therefore', 'furthermore', 'however']):
-            scores["document"] += 2
-        
-        # Social media indicators
-        if '#' in text or '@' in text:
-            scores["social"] += 2
-        if len(text) < 200 and ('!' in text or '?' in text):
-            scores["social"] += 1
-        
-        # Technical indicators
-        tech_terms = {'api', 'database', 'server', 'client', 'protocol', 'algorithm'}
-        if any(term in text_lower for term in tech_terms):
-            scores["technical"] += 2
-        
-        # Creative indicators
-        if any(word in text_lower for word in ['story', 'poem', 'novel', 'metaphor']):
-            scores["creative"] += 2
-        if len(re.findall(r'[.!?].*[.!?]', text)) > 2:  # Complex sentence structure
-            scores["creative"] += 1
-        
-        # Determine primary type
-        primary_type = max(scores, key=scores.get)
-        confidence = scores[primary_type] / sum(scores.values()) if sum(scores.values()) > 0 else 0
-        
-        return {
-            "primary_type": primary_type,
-            "confidence": min(confidence, 1.0),
-            "scores": scores
-        }
+        result = _memoized(_text_type_impl, text)
+        return {**result, "scores": dict(result["scores"])}
 
 
 class TextValidator:
@@ -182,7 +269,8 @@ class TextValidator:
         """Validate input text for processing"""
         errors = []
         
-        if not text or not text.strip():
+        # Cheapest checks first; whitespace-only text also has no words
+        if not text:
             errors.append("Text is empty or whitespace only")
             return False, errors
         
@@ -190,20 +278,15 @@ class TextValidator:
             errors.append("Text too long (max 10,000 characters)")
             return False, errors
         
-        if len(text.split()) < 1:
-            errors.append("Text contains no words")
+        if text.isspace():
+            errors.append("Text is empty or whitespace only")
             return False, errors
         
-        # Check for suspicious content
-        suspicious_patterns = [
-            (r'<script', "Potentially unsafe HTML content"),
-            (r'javascript:', "Potentially unsafe JavaScript"),
-            (r'on\w+\s*=', "Potentially unsafe event handlers")
-        ]
-        
-        for pattern, message in suspicious_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                errors.append(message)
+        # Check for suspicious content, naming each pattern only on a hit
+        if _SUSPICIOUS_RE.search(text):
+            for pattern, message in _SUSPICIOUS_PATTERNS:
+                if pattern.search(text):
+                    errors.append(message)
         
         return len(errors) == 0, errors
     
@@ -228,14 +311,18 @@ class CacheManager:
     """Simple caching system for processed text"""
     
     def __init__(self, max_size: int = 1000, ttl: int = 3600):
-        self.cache = {}
+        # Entries are (timestamp, result), ordered from least to most recently used
+        self.cache = OrderedDict()
         self.max_size = max_size
         self.ttl = ttl
-        self.access_times = {}
+        self.hits = 0
+        self.misses = 0
     
-    def _generate_key(self, text: str, options_hash: str) -> str:
+    def _generate_key(self, text: str, options_hash: str) -> Tuple[str, str]:
         """Generate cache key"""
-        return hashlib.md5((text + options_hash).encode()).hexdigest()
+        # Keys never leave the process, so the dict can hash the strings itself.
+        # Interning the options hash lets repeated option sets compare by identity.
+        return (text, sys.intern(options_hash))
     
     def _is_expired(self, timestamp: float) -> bool:
         """Check if cache entry is expired"""
@@ -244,68 +331,81 @@ class CacheManager:
     def get(self, text: str, options_hash: str) -> Optional[Any]:
         """Get cached result"""
         key = self._generate_key(text, options_hash)
+        entry = self.cache.get(key)
         
-        if key in self.cache:
-            if self._is_expired(self.access_times[key]):
+        if entry is not None:
+            timestamp, result = entry
+            if self._is_expired(timestamp):
                 self._remove(key)
+                self.misses += 1
                 return None
             
-            # Update access time
-            self.access_times[key] = time.time()
-            return self.cache[key]
+            # Update access time and mark as most recently used
+            self.cache[key] = (time.time(), result)
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return result
         
+        self.misses += 1
         return None
     
     def set(self, text: str, options_hash: str, result: Any) -> None:
         """Cache result"""
         key = self._generate_key(text, options_hash)
         
-        # Remove oldest entries if cache is full
-        if len(self.cache) >= self.max_size:
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        elif len(self.cache) >= self.max_size:
+            # Remove oldest entry if cache is full
             self._evict_oldest()
         
-        self.cache[key] = result
-        self.access_times[key] = time.time()
+        self.cache[key] = (time.time(), result)
     
-    def _remove(self, key: str) -> None:
+    def _remove(self, key: Tuple[str, str]) -> None:
         """Remove cache entry"""
         self.cache.pop(key, None)
-        self.access_times.pop(key, None)
     
     def _evict_oldest(self) -> None:
-        """Remove oldest accessed entry"""
-        if not self.access_times:
-            return
-        
-        oldest_key = min(self.access_times, key=self.access_times.get)
-        self._remove(oldest_key)
+        """Remove least recently accessed entry"""
+        if self.cache:
+            self.cache.popitem(last=False)
     
     def clear(self) -> None:
         """Clear all cache entries"""
         self.cache.clear()
-        self.access_times.clear()
+    
+    def size(self) -> int:
+        """Number of cached entries"""
+        return len(self.cache)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
+        lookups = self.hits + self.misses
         return {
             "size": len(self.cache),
             "max_size": self.max_size,
-            "hit_ratio": getattr(self, '_hit_ratio', 0.0),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups > 0 else 0.0,
             "entries": len(self.cache)
         }
 
 
 class PerformanceMonitor:
-    """Monitor processing performance"""
+    """Monitor processing performance
+    
+    Safe to share between threads; updates and reports are serialized
+    by an internal lock so concurrent increments are not lost.
+    """
     
     def __init__(self):
+        self._lock = threading.Lock()
         self.metrics = {
             "total_processed": 0,
             "total_time": 0.0,
-            "average_time": 0.0,
             "errors": 0,
-            "context_usage": {},
-            "tone_usage": {}
+            "context_usage": defaultdict(int),
+            "tone_usage": defaultdict(int)
         }
     
     def record_processing(
@@ -316,58 +416,56 @@ class PerformanceMonitor:
         success: bool = True
     ) -> None:
         """Record processing metrics"""
-        self.metrics["total_processed"] += 1
-        self.metrics["total_time"] += processing_time
-        self.metrics["average_time"] = (
-            self.metrics["total_time"] / self.metrics["total_processed"]
-        )
-        
-        if not success:
-            self.metrics["errors"] += 1
-        
-        # Track context usage
-        self.metrics["context_usage"][context] = (
-            self.metrics["context_usage"].get(context, 0) + 1
-        )
-        
-        # Track tone usage
-        self.metrics["tone_usage"][tone] = (
-            self.metrics["tone_usage"].get(tone, 0) + 1
-        )
+        with self._lock:
+            self.metrics["total_processed"] += 1
+            self.metrics["total_time"] += processing_time
+            
+            if not success:
+                self.metrics["errors"] += 1
+            
+            # Track context and tone usage
+            self.metrics["context_usage"][context] += 1
+            self.metrics["tone_usage"][tone] += 1
     
     def get_report(self) -> Dict[str, Any]:
         """Get performance report"""
-        error_rate = (
-            self.metrics["errors"] / self.metrics["total_processed"]
-            if self.metrics["total_processed"] > 0 else 0
-        )
+        with self._lock:
+            total_processed = self.metrics["total_processed"]
+            total_time = self.metrics["total_time"]
+            errors = self.metrics["errors"]
+            context_usage = dict(self.metrics["context_usage"])
+            tone_usage = dict(self.metrics["tone_usage"])
+        
+        error_rate = errors / total_processed if total_processed > 0 else 0
+        average_time = total_time / max(total_processed, 1)
         
         return {
-            "total_processed": self.metrics["total_processed"],
-            "total_time_seconds": round(self.metrics["total_time"], 2),
-            "average_time_seconds": round(self.metrics["average_time"], 3),
+            "total_processed": total_processed,
+            "total_time_seconds": round(total_time, 2),
+            "average_time_seconds": round(average_time, 3),
             "error_rate": round(error_rate, 3),
             "most_used_context": max(
-                self.metrics["context_usage"], 
-                key=self.metrics["context_usage"].get, 
+                context_usage, 
+                key=context_usage.get, 
                 default="none"
             ),
             "most_used_tone": max(
-                self.metrics["tone_usage"], 
-                key=self.metrics["tone_usage"].get, 
+                tone_usage, 
+                key=tone_usage.get, 
                 default="none"
             ),
-            "context_breakdown": self.metrics["context_usage"],
-            "tone_breakdown": self.metrics["tone_usage"]
+            "context_breakdown": context_usage,
+            "tone_breakdown": tone_usage
         }
     
     def reset(self) -> None:
         """Reset metrics"""
-        for key in self.metrics:
-            if isinstance(self.metrics[key], (int, float)):
-                self.metrics[key] = 0
-            elif isinstance(self.metrics[key], dict):
-                self.metrics[key] = {}
+        with self._lock:
+            for key in self.metrics:
+                if isinstance(self.metrics[key], (int, float)):
+                    self.metrics[key] = 0
+                elif isinstance(self.metrics[key], dict):
+                    self.metrics[key] = defaultdict(int)
 
 
 class TextUtils:
@@ -377,15 +475,17 @@ class TextUtils:
     def clean_text(text: str) -> str:
         """Clean text for processing"""
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
-        # Remove control characters except newlines and tabs
-        text = ''.join(char for char in text if char.isprintable() or char in '\n\t')
+        # Remove control characters except newlines and tabs; most text has
+        # none, so skip the per-character filter when all chars are printable
+        if not text.isprintable():
+            text = ''.join(char for char in text if char.isprintable() or char in '\n\t')
         
         return text.strip()
     
     @staticmethod
-    def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
+    def truncate_text(text: str, max_length: int, suffix: str = _DEFAULT_SUFFIX) -> str:
         """Truncate text to specified length"""
         if len(text) <= max_length:
             return text
@@ -395,22 +495,38 @@ class TextUtils:
         
         return text[:max_length - len(suffix)] + suffix
     
+    @staticmethod
+    def truncate_batch(
+        texts: List[str], 
+        max_length: int, 
+        suffix: str = _DEFAULT_SUFFIX
+    ) -> List[str]:
+        """Truncate each text in a batch to specified length"""
+        if max_length <= len(suffix):
+            return [text[:max_length] for text in texts]
+        
+        cut = max_length - len(suffix)
+        return [
+            text if len(text) <= max_length else text[:cut] + suffix
+            for text in texts
+        ]
+    
     @staticmethod
     def word_count(text: str) -> int:
         """Count words in text"""
-        return len(re.findall(r'\b\w+\b', text))
+        return len(_WORD_RE.findall(text))
     
     @staticmethod
     def character_count(text: str, include_spaces: bool = True) -> int:
         """Count characters in text"""
         if include_spaces:
             return len(text)
-        return len(text.replace(' ', ''))
+        return len(text) - text.count(' ')
     
     @staticmethod
     def sentence_count(text: str) -> int:
         """Count sentences in text"""
-        return len(re.findall(r'[.!?]+', text))
+        return sum(1 for _ in _SENTENCE_SPLIT_RE.finditer(text))
     
     @staticmethod
     def paragraph_count(text: str) -> int:
@@ -420,47 +536,39 @@ class TextUtils:
     @staticmethod
     def extract_keywords(text: str, max_keywords: int = 10) -> List[str]:
         """Extract keywords from text"""
-        # Simple keyword extraction based on frequency
-        words = re.findall(r'\b\w+\b', text.lower())
-        
-        # Remove common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
-            'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
-            'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
-        }
-        
-        filtered_words = [word for word in words if word not in stop_words and len(word) > 2]
-        word_freq = Counter(filtered_words)
-        
-        return [word for word, freq in word_freq.most_common(max_keywords)]
+        return list(_memoized(_keywords_impl, text, max_keywords))
     
     @staticmethod
     def generate_summary(text: str, max_sentences: int = 3) -> str:
         """Generate a simple summary of text"""
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
         sentences = [s.strip() for s in sentences if s.strip()]
         
         if len(sentences) <= max_sentences:
             return text
         
         # Simple scoring based on sentence length and position
-        scored_sentences = []
-        for i, sentence in enumerate(sentences):
-            score = len(sentence.split())  # Length score
-            score += (len(sentences) - i) * 0.5  # Position score
-            scored_sentences.append((score, sentence))
+        # (length score + position score, sentence, original index)
+        scored_sentences = [
+            (len(sentence.split()) + (len(sentences) - i) * 0.5, sentence, i)
+            for i, sentence in enumerate(sentences)
+        ]
         
-        # Sort by score and take top sentences
-        top_sentences = sorted(scored_sentences, reverse=True)[:max_sentences]
-        top_sentences.sort(key=lambda x: sentences.index(x[1]))  # Maintain original order
+        # Take top sentences by score
+        top_sentences = heapq.nlargest(max_sentences, scored_sentences)
+        top_sentences.sort(key=itemgetter(2))  # Maintain original order
         
-        return '. '.join(sentence for _, sentence in top_sentences) + '.'
+        return '. '.join(sentence for _, sentence, _ in top_sentences) + '.'
 
 
 class Logger:
-    """Simple logging wrapper"""
+    """Simple logging wrapper
+    
+    Messages are formatted lazily by the stdlib, so pass arguments
+    separately: ``log.debug("processed %d words in %.3fs", n, dt)``
+    rather than an f-string, which is formatted even when the level is
+    disabled.
+    """
     
     def __init__(self, name: str = "AITextProcessor"):
         self.logger = logging.getLogger(name)
@@ -474,14 +582,14 @@ class Logger:
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
     
-    def info(self, message: str) -> None:
-        self.logger.info(message)
+    def info(self, message: str, *args, **kwargs) -> None:
+        self.logger.info(message, *args, **kwargs)
     
-    def warning(self, message: str) -> None:
-        self.logger.warning(message)
+    def warning(self, message: str, *args, **kwargs) -> None:
+        self.logger.warning(message, *args, **kwargs)
     
-    def error(self, message: str) -> None:
-        self.logger.error(message)
+    def error(self, message: str, *args, **kwargs) -> None:
+        self.logger.error(message, *args, **kwargs)
     
-    def debug(self, message: str) -> None:
-        self.logger.debug(message)
+    def debug(self, message: str, *args, **kwargs) -> None:
+        self.logger.debug(message, *args, **kwargs)